@@ -7,7 +7,7 @@ Usage:
     handler = get_platform_handler()
     handler.set_startup_enabled(True)
 """
-import platform as sys_platform
+import sys
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -16,6 +16,10 @@ if TYPE_CHECKING:
 # Cached handler instance
 _handler = None
 
+# sys.platform is fixed at interpreter startup, unlike platform.system()
+# which goes through uname(); anything unrecognised is treated as Linux
+_PLATFORM_NAMES = {"win32": "Windows", "darwin": "Darwin"}
+
 
 def get_platform_handler() -> "PlatformHandler":
     """
@@ -28,7 +32,7 @@ def get_platform_handler() -> "PlatformHandler":
     if _handler is not None:
         return _handler
     
-    system = sys_platform.system()
+    system = get_platform_name()
     
     if system == "Windows":
         from platform_handlers.windows import WindowsPlatformHandler
@@ -45,7 +49,7 @@ def get_platform_handler() -> "PlatformHandler":
 
 def get_platform_name() -> str:
     """Get the current platform name (Windows, Darwin, Linux)."""
-    return sys_platform.system()
+    return _PLATFORM_NAMES.get(sys.platform, "Linux")
 
 
 # Export base class for type hints
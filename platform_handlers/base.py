@@ -1,12 +1,38 @@
 """
 Platform Base - Abstract base class for platform-specific functionality
 """
+import os
+import shutil
+import time
 from abc import ABC, abstractmethod
+from functools import wraps
 from pathlib import Path
 from typing import Optional
 import tkinter as tk
 
 
+def ttl_cache(seconds: float):
+    """
+    Cache a no-argument handler method's result for a short time.
+    
+    Results are stored per instance and dropped early by
+    PlatformHandler._invalidate_cached_checks().
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self):
+            cache = self.__dict__.setdefault("_ttl_values", {})
+            now = time.monotonic()
+            hit = cache.get(method.__name__)
+            if hit is not None and hit[1] > now:
+                return hit[0]
+            value = method(self)
+            cache[method.__name__] = (value, now + seconds)
+            return value
+        return wrapper
+    return decorator
+
+
 class PlatformHandler(ABC):
     """Abstract base class for platform-specific functionality."""
     
@@ -133,6 +159,78 @@ class PlatformHandler(ABC):
         """
         pass
     
+    def _invalidate_cached_checks(self) -> None:
+        """Drop cached startup/shortcut checks after changing them."""
+        self.__dict__.pop("_ttl_values", None)
+    
+    def _sync_dir(self, src: Path, dst: Path) -> None:
+        """
+        Mirror src into dst, copying only files whose size or mtime differ.
+        
+        Entries in dst that no longer exist in src are removed, so the
+        result matches a fresh copytree without rewriting unchanged files.
+        """
+        if dst.exists() and not dst.is_dir():
+            dst.unlink()
+        dst.mkdir(parents=True, exist_ok=True)
+        
+        with os.scandir(dst) as it:
+            existing = {entry.name: entry for entry in it}
+        
+        with os.scandir(src) as it:
+            for entry in it:
+                target = existing.pop(entry.name, None)
+                dst_path = dst / entry.name
+                
+                if entry.is_dir():
+                    self._sync_dir(Path(entry.path), dst_path)
+                    continue
+                
+                if target is not None:
+                    if target.is_dir(follow_symlinks=False):
+                        shutil.rmtree(target.path)
+                    else:
+                        src_stat = entry.stat()
+                        dst_stat = target.stat(follow_symlinks=False)
+                        if (src_stat.st_size == dst_stat.st_size
+                                and src_stat.st_mtime_ns == dst_stat.st_mtime_ns):
+                            continue
+                
+                shutil.copy2(entry.path, dst_path)
+        
+        # Anything left was removed from src
+        for stale in existing.values():
+            if stale.is_dir(follow_symlinks=False):
+                shutil.rmtree(stale.path)
+            else:
+                os.unlink(stale.path)
+    
+    def _write_if_changed(self, path: Path, data: bytes, mode: int = 0o644) -> bool:
+        """
+        Atomically write data to path unless it already holds exactly that.
+        
+        The file is written to a sibling temp file and renamed into place,
+        so readers never see a partial file. An unchanged file still gets
+        mode re-applied if it drifted (e.g. a .desktop file that lost its
+        exec bit). Returns True if the content was written.
+        """
+        try:
+            if path.read_bytes() == data:
+                if os.stat(path).st_mode & 0o777 != mode:
+                    os.chmod(path, mode)
+                return False
+        except FileNotFoundError:
+            pass
+        
+        tmp_path = path.with_name(path.name + ".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+        return True
+    
     # =========================================================================
     # Dialog/Window Configuration
     # =========================================================================
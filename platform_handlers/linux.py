@@ -4,11 +4,48 @@ Linux Platform Handler
 import os
 import sys
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import tkinter as tk
 
-from platform_handlers.base import PlatformHandler
+from platform_handlers.base import PlatformHandler, ttl_cache
+
+# Per-user autostart entry, per the XDG Autostart spec
+_AUTOSTART_PATH = (
+    Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config")
+    / "autostart" / "project-launcher.desktop"
+)
+
+# XDG_DESKTOP_DIR may be set in user-dirs.dirs
+_DESKTOP_FOLDER = Path(os.environ.get("XDG_DESKTOP_DIR") or Path.home() / "Desktop")
+_APPLICATIONS_FOLDER = (
+    Path(os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share")
+    / "applications"
+)
+
+# .desktop file templates, filled in with str.format_map at write time
+_AUTOSTART_DESKTOP_TEMPLATE = '''[Desktop Entry]
+Type=Application
+Name=Project Launcher
+Comment=Launch development projects
+Exec="{exe_path}" --auto
+Path={working_dir}
+Hidden=false
+NoDisplay=false
+X-GNOME-Autostart-enabled=true
+Terminal=false
+'''
+
+_MENU_DESKTOP_TEMPLATE = '''[Desktop Entry]
+Type=Application
+Name=Project Launcher
+Comment=Launch development projects
+Exec="{exe_path}"
+Path={working_dir}
+Terminal=false
+Categories=Development;
+'''
 
 
 class LinuxPlatformHandler(PlatformHandler):
@@ -42,6 +79,7 @@ class LinuxPlatformHandler(PlatformHandler):
     # Path Helpers
     # =========================================================================
     
+    @lru_cache(maxsize=1)
     def _get_executable_path(self) -> Path:
         """Get the path to the running executable."""
         if getattr(sys, 'frozen', False):
@@ -51,22 +89,18 @@ class LinuxPlatformHandler(PlatformHandler):
     
     def _get_autostart_path(self) -> Path:
         """Get path to the Linux autostart .desktop file."""
-        config_home = os.environ.get("XDG_CONFIG_HOME", "")
-        if not config_home:
-            config_home = Path.home() / ".config"
-        else:
-            config_home = Path(config_home)
-        
-        return config_home / "autostart" / "project-launcher.desktop"
+        return _AUTOSTART_PATH
     
     # =========================================================================
     # Installation
     # =========================================================================
     
+    @lru_cache(maxsize=1)
     def get_install_dir(self) -> Path:
         """Linux: Install to ~/.local/share."""
         return Path.home() / ".local" / "share" / "ProjectLauncher"
     
+    @lru_cache(maxsize=1)
     def get_installed_exe_path(self) -> Path:
         """Linux: Return executable path."""
         return self.get_install_dir() / "project-launcher"
@@ -75,12 +109,14 @@ class LinuxPlatformHandler(PlatformHandler):
     # Startup
     # =========================================================================
     
+    @ttl_cache(seconds=2)
     def is_startup_enabled(self) -> bool:
         """Check if Linux startup is enabled."""
-        return self._get_autostart_path().exists()
+        return os.path.exists(self._get_autostart_path())
     
     def set_startup_enabled(self, enabled: bool) -> bool:
         """Enable or disable Linux startup via XDG autostart."""
+        self._invalidate_cached_checks()
         if enabled:
             return self._enable_startup()
         else:
@@ -90,30 +126,19 @@ class LinuxPlatformHandler(PlatformHandler):
         """Enable startup on Linux using XDG autostart."""
         try:
             autostart_dir = self._get_autostart_path().parent
-            autostart_dir.mkdir(parents=True, exist_ok=True)
+            if not autostart_dir.exists():
+                autostart_dir.mkdir(parents=True, exist_ok=True)
             
             exe_path = self._get_executable_path()
             working_dir = exe_path.parent
             
             # Create .desktop file
-            desktop_content = f'''[Desktop Entry]
-Type=Application
-Name=Project Launcher
-Comment=Launch development projects
-Exec="{exe_path}" --auto
-Path={working_dir}
-Hidden=false
-NoDisplay=false
-X-GNOME-Autostart-enabled=true
-Terminal=false
-'''
+            desktop_content = _AUTOSTART_DESKTOP_TEMPLATE.format_map({
+                "exe_path": exe_path,
+                "working_dir": working_dir,
+            })
             
-            desktop_path = self._get_autostart_path()
-            with open(desktop_path, "w") as f:
-                f.write(desktop_content)
-            
-            # Make it executable
-            os.chmod(desktop_path, 0o755)
+            self._write_desktop_file(self._get_autostart_path(), desktop_content)
             
             return True
         except Exception as e:
@@ -141,20 +166,15 @@ Terminal=false
     
     def _get_desktop_folder(self) -> Path:
         """Get Linux desktop folder path."""
-        # XDG_DESKTOP_DIR may be set in user-dirs.dirs
-        xdg_desktop = os.environ.get("XDG_DESKTOP_DIR")
-        if xdg_desktop:
-            return Path(xdg_desktop)
-        return Path.home() / "Desktop"
+        return _DESKTOP_FOLDER
     
     def _get_applications_folder(self) -> Path:
         """Get Linux applications folder path."""
-        data_home = os.environ.get("XDG_DATA_HOME", "")
-        if not data_home:
-            data_home = Path.home() / ".local" / "share"
-        else:
-            data_home = Path(data_home)
-        return data_home / "applications"
+        return _APPLICATIONS_FOLDER
+    
+    def _write_desktop_file(self, path: Path, content: str) -> None:
+        """Write a .desktop file, created executable, if its content changed."""
+        self._write_if_changed(path, content.encode("utf-8"), 0o755)
     
     def _create_desktop_file(self, path: Path) -> bool:
         """Create a .desktop file."""
@@ -162,34 +182,31 @@ Terminal=false
             exe_path = self._get_executable_path()
             working_dir = exe_path.parent
             
-            desktop_content = f'''[Desktop Entry]
-Type=Application
-Name=Project Launcher
-Comment=Launch development projects
-Exec="{exe_path}"
-Path={working_dir}
-Terminal=false
-Categories=Development;
-'''
+            desktop_content = _MENU_DESKTOP_TEMPLATE.format_map({
+                "exe_path": exe_path,
+                "working_dir": working_dir,
+            })
             
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "w") as f:
-                f.write(desktop_content)
-            os.chmod(path, 0o755)
+            if not path.parent.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_desktop_file(path, desktop_content)
             return True
         except Exception as e:
             print(f"Error creating desktop file: {e}")
             return False
     
+    @ttl_cache(seconds=2)
     def has_desktop_shortcut(self) -> bool:
         desktop_path = self._get_desktop_folder() / "project-launcher.desktop"
         return desktop_path.exists()
     
     def create_desktop_shortcut(self) -> bool:
+        self._invalidate_cached_checks()
         desktop_path = self._get_desktop_folder() / "project-launcher.desktop"
         return self._create_desktop_file(desktop_path)
     
     def remove_desktop_shortcut(self) -> bool:
+        self._invalidate_cached_checks()
         try:
             desktop_path = self._get_desktop_folder() / "project-launcher.desktop"
             if desktop_path.exists():
@@ -198,6 +215,7 @@ Categories=Development;
         except Exception:
             return False
     
+    @ttl_cache(seconds=2)
     def has_start_menu_shortcut(self) -> bool:
         """Check if applications menu entry exists."""
         apps_path = self._get_applications_folder() / "project-launcher.desktop"
@@ -205,11 +223,13 @@ Categories=Development;
     
     def create_start_menu_shortcut(self) -> bool:
         """Create applications menu entry."""
+        self._invalidate_cached_checks()
         apps_path = self._get_applications_folder() / "project-launcher.desktop"
         return self._create_desktop_file(apps_path)
     
     def remove_start_menu_shortcut(self) -> bool:
         """Remove applications menu entry."""
+        self._invalidate_cached_checks()
         try:
             apps_path = self._get_applications_folder() / "project-launcher.desktop"
             if apps_path.exists():
@@ -261,10 +281,7 @@ Categories=Development;
             current_dir = current_exe.parent
             assets_dir = current_dir / "assets"
             if assets_dir.exists():
-                target_assets = install_dir / "assets"
-                if target_assets.exists():
-                    shutil.rmtree(target_assets)
-                shutil.copytree(assets_dir, target_assets)
+                self._sync_dir(assets_dir, install_dir / "assets")
             
             result["success"] = True
             result["install_path"] = str(target_exe)
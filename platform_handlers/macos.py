@@ -4,12 +4,68 @@ macOS Platform Handler
 import os
 import sys
 import shutil
-import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import tkinter as tk
 
-from platform_handlers.base import PlatformHandler
+from platform_handlers.base import PlatformHandler, ttl_cache
+
+# Per-user LaunchAgent; launchd loads it at login
+_LAUNCH_AGENT_LABEL = "com.projectlauncher"
+_LAUNCH_AGENT_PATH = Path.home() / "Library" / "LaunchAgents" / f"{_LAUNCH_AGENT_LABEL}.plist"
+
+# LaunchAgent plist templates, filled in with str.format_map at enable time
+_APP_PLIST_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+    <key>Label</key>
+    <string>com.projectlauncher</string>
+    <key>ProgramArguments</key>
+    <array>
+        <string>/usr/bin/open</string>
+        <string>-a</string>
+        <string>{exe_path}</string>
+        <string>--args</string>
+        <string>--auto</string>
+    </array>
+    <key>RunAtLoad</key>
+    <true/>
+    <key>LaunchOnlyOnce</key>
+    <true/>
+    <key>StandardOutPath</key>
+    <string>/tmp/projectlauncher.log</string>
+    <key>StandardErrorPath</key>
+    <string>/tmp/projectlauncher.err</string>
+</dict>
+</plist>
+'''
+
+_BINARY_PLIST_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+    <key>Label</key>
+    <string>com.projectlauncher</string>
+    <key>ProgramArguments</key>
+    <array>
+        <string>{exe_path}</string>
+        <string>--auto</string>
+    </array>
+    <key>WorkingDirectory</key>
+    <string>{working_dir}</string>
+    <key>RunAtLoad</key>
+    <true/>
+    <key>LaunchOnlyOnce</key>
+    <true/>
+    <key>StandardOutPath</key>
+    <string>/tmp/projectlauncher.log</string>
+    <key>StandardErrorPath</key>
+    <string>/tmp/projectlauncher.err</string>
+</dict>
+</plist>
+'''
 
 
 class MacOSPlatformHandler(PlatformHandler):
@@ -43,6 +99,7 @@ class MacOSPlatformHandler(PlatformHandler):
     # Path Helpers
     # =========================================================================
     
+    @lru_cache(maxsize=1)
     def _get_executable_path(self) -> Path:
         """Get the path to the running executable or .app bundle."""
         if getattr(sys, 'frozen', False):
@@ -61,12 +118,13 @@ class MacOSPlatformHandler(PlatformHandler):
     
     def _get_launch_agent_path(self) -> Path:
         """Get path to the macOS LaunchAgent plist."""
-        return Path.home() / "Library" / "LaunchAgents" / "com.projectlauncher.plist"
+        return _LAUNCH_AGENT_PATH
     
     # =========================================================================
     # Installation
     # =========================================================================
     
+    @lru_cache(maxsize=1)
     def get_install_dir(self) -> Path:
         """macOS: Install to /Applications or ~/Applications."""
         system_apps = Path("/Applications")
@@ -74,6 +132,7 @@ class MacOSPlatformHandler(PlatformHandler):
             return system_apps
         return Path.home() / "Applications"
     
+    @lru_cache(maxsize=1)
     def get_installed_exe_path(self) -> Path:
         """macOS: Return .app bundle path."""
         return self.get_install_dir() / "ProjectLauncher.app"
@@ -82,12 +141,14 @@ class MacOSPlatformHandler(PlatformHandler):
     # Startup
     # =========================================================================
     
+    @ttl_cache(seconds=2)
     def is_startup_enabled(self) -> bool:
         """Check if macOS startup is enabled."""
-        return self._get_launch_agent_path().exists()
+        return os.path.exists(self._get_launch_agent_path())
     
     def set_startup_enabled(self, enabled: bool) -> bool:
         """Enable or disable macOS startup via LaunchAgent."""
+        self._invalidate_cached_checks()
         if enabled:
             return self._enable_startup()
         else:
@@ -96,72 +157,33 @@ class MacOSPlatformHandler(PlatformHandler):
     def _enable_startup(self) -> bool:
         """Enable startup on macOS using LaunchAgent."""
         try:
-            launch_agents_dir = Path.home() / "Library" / "LaunchAgents"
-            launch_agents_dir.mkdir(parents=True, exist_ok=True)
+            launch_agents_dir = _LAUNCH_AGENT_PATH.parent
+            if not launch_agents_dir.exists():
+                launch_agents_dir.mkdir(parents=True, exist_ok=True)
             
             exe_path = self._get_executable_path()
             
             # For .app bundles, use 'open' command with --args
             if str(exe_path).endswith(".app"):
-                plist_content = f'''<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>Label</key>
-    <string>com.projectlauncher</string>
-    <key>ProgramArguments</key>
-    <array>
-        <string>/usr/bin/open</string>
-        <string>-a</string>
-        <string>{exe_path}</string>
-        <string>--args</string>
-        <string>--auto</string>
-    </array>
-    <key>RunAtLoad</key>
-    <true/>
-    <key>LaunchOnlyOnce</key>
-    <true/>
-    <key>StandardOutPath</key>
-    <string>/tmp/projectlauncher.log</string>
-    <key>StandardErrorPath</key>
-    <string>/tmp/projectlauncher.err</string>
-</dict>
-</plist>
-'''
+                plist_content = _APP_PLIST_TEMPLATE.format_map({"exe_path": exe_path})
             else:
                 # For standalone binary (non-.app)
-                working_dir = exe_path.parent
-                plist_content = f'''<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>Label</key>
-    <string>com.projectlauncher</string>
-    <key>ProgramArguments</key>
-    <array>
-        <string>{exe_path}</string>
-        <string>--auto</string>
-    </array>
-    <key>WorkingDirectory</key>
-    <string>{working_dir}</string>
-    <key>RunAtLoad</key>
-    <true/>
-    <key>LaunchOnlyOnce</key>
-    <true/>
-    <key>StandardOutPath</key>
-    <string>/tmp/projectlauncher.log</string>
-    <key>StandardErrorPath</key>
-    <string>/tmp/projectlauncher.err</string>
-</dict>
-</plist>
-'''
+                plist_content = _BINARY_PLIST_TEMPLATE.format_map({
+                    "exe_path": exe_path,
+                    "working_dir": exe_path.parent,
+                })
             
+            # Already installed with identical content - nothing to write or load
             plist_path = self._get_launch_agent_path()
-            with open(plist_path, "w") as f:
-                f.write(plist_content)
+            if not self._write_if_changed(plist_path, plist_content.encode("utf-8")):
+                return True
             
-            # Load the LaunchAgent
-            subprocess.run(["launchctl", "load", str(plist_path)], capture_output=True)
+            # Load the LaunchAgent into the user's GUI domain
+            import subprocess
+            subprocess.run(
+                ["launchctl", "bootstrap", f"gui/{os.getuid()}", str(plist_path)],
+                capture_output=True
+            )
             
             return True
         except Exception as e:
@@ -174,8 +196,12 @@ class MacOSPlatformHandler(PlatformHandler):
             plist_path = self._get_launch_agent_path()
             
             if plist_path.exists():
-                # Unload the LaunchAgent
-                subprocess.run(["launchctl", "unload", str(plist_path)], capture_output=True)
+                # Unload the LaunchAgent from the user's GUI domain
+                import subprocess
+                subprocess.run(
+                    ["launchctl", "bootout", f"gui/{os.getuid()}/{_LAUNCH_AGENT_LABEL}"],
+                    capture_output=True
+                )
                 plist_path.unlink()
             
             return True
@@ -4,17 +4,189 @@ Windows Platform Handler
 import os
 import sys
 import shutil
-import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 import tkinter as tk
 
-from platform_handlers.base import PlatformHandler
+if TYPE_CHECKING:
+    import subprocess  # Imported lazily at runtime, where it is used
+
+from platform_handlers.base import PlatformHandler, ttl_cache
+
+# Start Menu, Startup and Desktop folders for the current user
+_START_MENU_FOLDER = (
+    Path(os.environ.get("APPDATA") or Path.home() / "AppData" / "Roaming")
+    / "Microsoft" / "Windows" / "Start Menu" / "Programs"
+)
+_STARTUP_FOLDER = _START_MENU_FOLDER / "Startup"
+_DESKTOP_FOLDER = Path.home() / "Desktop"
+
+_SHORTCUT_NAME = "Project Launcher.lnk"
+_STARTUP_SHORTCUT_NAME = "ProjectLauncher.lnk"
+
+# Marker file in the install dir recording that legacy startup entries are gone
+_LEGACY_CLEANED_MARKER = ".legacy_cleaned"
+
+# HRESULT_FROM_WIN32(ERROR_FILE_NOT_FOUND) as pywin32 reports it (signed)
+_HRESULT_FILE_NOT_FOUND = -2147024894  # 0x80070002
+
+
+def _is_not_found_error(error: Exception) -> bool:
+    """
+    Return True if a pywin32 com_error means "file/task not found".
+    
+    Errors raised inside a dispatch call come back as DISP_E_EXCEPTION
+    with the real HRESULT in excepinfo[5], so both places are checked.
+    """
+    excepinfo = getattr(error, "excepinfo", None) or (None,) * 6
+    return _HRESULT_FILE_NOT_FOUND in (getattr(error, "hresult", None), excepinfo[5])
+
+
+# Process creation flags for hidden helper tools (same values as the
+# subprocess constants, which only exist on Windows builds of Python).
+# DETACHED_PROCESS skips console allocation entirely, so no conhost is spawned
+_CREATE_NO_WINDOW = 0x08000000
+_DETACHED_PROCESS = 0x00000008
+_HIDDEN_CREATIONFLAGS = _CREATE_NO_WINDOW | _DETACHED_PROCESS
+
+
+@lru_cache(maxsize=1)
+def _hidden_startupinfo():
+    """STARTUPINFO that keeps spawned console tools hidden (built on first use)."""
+    import subprocess
+    startupinfo = subprocess.STARTUPINFO()
+    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    startupinfo.wShowWindow = 0  # SW_HIDE
+    return startupinfo
+
+
+@lru_cache(maxsize=1)
+def _win32com_client():
+    """
+    Return win32com.client, or None if pywin32 is not installed.
+    
+    Resolved on first use and remembered: a failed import is not cached
+    in sys.modules, so retrying it would search sys.path on every call.
+    """
+    try:
+        import win32com.client
+    except ImportError:
+        return None
+    return win32com.client
+
+
+@lru_cache(maxsize=1)
+def _get_wscript_shell():
+    """
+    Get a WScript.Shell instance, created on first use and then reused.
+    
+    Prefers an early-bound wrapper so property sets skip the per-call
+    name lookup, falling back to late binding when the wrapper can't be
+    generated (e.g. a read-only gen_py cache). Raises ImportError if
+    pywin32 is unavailable.
+    """
+    client = _win32com_client()
+    if client is None:
+        raise ImportError("pywin32 is not installed")
+    try:
+        return client.gencache.EnsureDispatch("WScript.Shell")
+    except Exception:
+        return client.Dispatch("WScript.Shell")
+
+
+# PowerShell fallback for shortcut creation. The script text never changes;
+# paths are passed through environment variables so quotes, spaces or $ in
+# them need no escaping and can't be interpreted as script
+_PS_SHORTCUT_SCRIPT = (
+    "$s = (New-Object -ComObject WScript.Shell).CreateShortcut($env:PL_LNK_PATH); "
+    "$s.TargetPath = $env:PL_LNK_TARGET; "
+    "$s.WorkingDirectory = $env:PL_LNK_WORKDIR; "
+    "$s.Description = $env:PL_LNK_DESC; "
+    "if ($env:PL_LNK_ICON) { $s.IconLocation = $env:PL_LNK_ICON }; "
+    "$s.Save()"
+)
+
+# COM identifiers and vtable slots used to create .lnk files via ctypes
+_CLSID_SHELL_LINK = "{00021401-0000-0000-C000-000000000046}"
+_IID_ISHELL_LINK_W = "{000214F9-0000-0000-C000-000000000046}"
+_IID_IPERSIST_FILE = "{0000010B-0000-0000-C000-000000000046}"
+_VT_QUERY_INTERFACE, _VT_RELEASE = 0, 2
+_VT_SET_DESCRIPTION, _VT_SET_WORKING_DIRECTORY = 7, 9
+_VT_SET_ICON_LOCATION, _VT_SET_PATH = 17, 20
+_VT_PERSIST_SAVE = 6
+
+
+def _com_call(obj, slot: int, restype, argtypes: tuple, *args):
+    """Call a COM interface method by its vtable slot."""
+    import ctypes
+    vtable = ctypes.cast(obj, ctypes.POINTER(ctypes.POINTER(ctypes.c_void_p))).contents
+    prototype = ctypes.WINFUNCTYPE(restype, ctypes.c_void_p, *argtypes)
+    return prototype(vtable[slot])(obj, *args)
+
+
+def _create_shell_link(shortcut_path: Path, target_path: Path,
+                       description: str, icon_location: Optional[str]) -> None:
+    """
+    Create a .lnk file through IShellLinkW/IPersistFile using ctypes.
+    
+    Raises OSError if any COM call fails.
+    """
+    import ctypes
+    from ctypes import wintypes
+    
+    class GUID(ctypes.Structure):
+        _fields_ = [
+            ("Data1", wintypes.DWORD),
+            ("Data2", wintypes.WORD),
+            ("Data3", wintypes.WORD),
+            ("Data4", ctypes.c_ubyte * 8),
+        ]
+    
+    ole32 = ctypes.oledll.ole32
+    
+    def guid(text):
+        value = GUID()
+        ole32.CLSIDFromString(text, ctypes.byref(value))
+        return value
+    
+    def release(obj):
+        _com_call(obj, _VT_RELEASE, wintypes.ULONG, ())
+    
+    hresult = ctypes.HRESULT
+    
+    initialized = ctypes.windll.ole32.CoInitialize(None) >= 0
+    link = ctypes.c_void_p()
+    persist = ctypes.c_void_p()
+    try:
+        ole32.CoCreateInstance(
+            ctypes.byref(guid(_CLSID_SHELL_LINK)), None, 1,  # CLSCTX_INPROC_SERVER
+            ctypes.byref(guid(_IID_ISHELL_LINK_W)), ctypes.byref(link)
+        )
+        _com_call(link, _VT_SET_PATH, hresult, (wintypes.LPCWSTR,), str(target_path))
+        _com_call(link, _VT_SET_WORKING_DIRECTORY, hresult, (wintypes.LPCWSTR,), str(target_path.parent))
+        _com_call(link, _VT_SET_DESCRIPTION, hresult, (wintypes.LPCWSTR,), description)
+        if icon_location:
+            _com_call(link, _VT_SET_ICON_LOCATION, hresult, (wintypes.LPCWSTR, ctypes.c_int), icon_location, 0)
+        
+        _com_call(link, _VT_QUERY_INTERFACE, hresult, (ctypes.c_void_p, ctypes.c_void_p),
+                  ctypes.byref(guid(_IID_IPERSIST_FILE)), ctypes.byref(persist))
+        _com_call(persist, _VT_PERSIST_SAVE, hresult, (wintypes.LPCWSTR, wintypes.BOOL), str(shortcut_path), True)
+    finally:
+        if persist:
+            release(persist)
+        if link:
+            release(link)
+        if initialized:
+            ctypes.windll.ole32.CoUninitialize()
 
 
 class WindowsPlatformHandler(PlatformHandler):
     """Windows-specific platform implementation."""
     
+    # Set once legacy startup cleanup has run (or its marker was found)
+    _legacy_cleaned = False
+    
     # =========================================================================
     # Dialog Configuration
     # =========================================================================
@@ -43,6 +215,7 @@ class WindowsPlatformHandler(PlatformHandler):
     # Path Helpers
     # =========================================================================
     
+    @lru_cache(maxsize=1)
     def _get_executable_path(self) -> Path:
         """Get the path to the running executable."""
         if getattr(sys, 'frozen', False):
@@ -50,61 +223,78 @@ class WindowsPlatformHandler(PlatformHandler):
         else:
             return Path(__file__).parent.parent / "project_launcher.py"
     
+    @lru_cache(maxsize=1)
+    def _executable_exists(self) -> bool:
+        """Check once whether the running executable is a file on disk."""
+        return os.path.isfile(self._get_executable_path())
+    
     def _get_startup_folder(self) -> Path:
         """Get Windows startup folder path."""
-        startup = os.environ.get("APPDATA", "")
-        if startup:
-            return Path(startup) / "Microsoft" / "Windows" / "Start Menu" / "Programs" / "Startup"
-        return Path.home() / "AppData" / "Roaming" / "Microsoft" / "Windows" / "Start Menu" / "Programs" / "Startup"
+        return _STARTUP_FOLDER
     
     def _get_desktop_folder(self) -> Path:
         """Get Windows desktop folder path."""
-        return Path.home() / "Desktop"
+        return _DESKTOP_FOLDER
     
     def _get_start_menu_folder(self) -> Path:
         """Get Windows Start Menu programs folder path."""
-        appdata = os.environ.get("APPDATA", "")
-        if appdata:
-            return Path(appdata) / "Microsoft" / "Windows" / "Start Menu" / "Programs"
-        return Path.home() / "AppData" / "Roaming" / "Microsoft" / "Windows" / "Start Menu" / "Programs"
+        return _START_MENU_FOLDER
     
     # =========================================================================
     # Shortcut Creation (Windows-specific)
     # =========================================================================
     
     def _create_shortcut(self, shortcut_path: Path, target_path: Path, 
-                         description: str = "", icon_path: Optional[Path] = None) -> bool:
-        """Create a Windows .lnk shortcut file."""
+                         description: str = "", icon_location: Optional[str] = None,
+                         shell=None) -> bool:
+        """
+        Create a Windows .lnk shortcut file.
+        
+        icon_location must already point at an existing icon; callers check
+        it once rather than per shortcut. Pass an existing WScript.Shell
+        dispatch as shell to reuse it.
+        """
         try:
             # Try using win32com first (most reliable)
             try:
-                import win32com.client
-                shell = win32com.client.Dispatch("WScript.Shell")
-                shortcut = shell.CreateShortCut(str(shortcut_path))
-                shortcut.TargetPath = str(target_path)
-                shortcut.WorkingDirectory = str(target_path.parent)
-                shortcut.Description = description
-                if icon_path and icon_path.exists():
-                    shortcut.IconLocation = str(icon_path)
-                shortcut.save()
+                if shell is None and _win32com_client() is not None:
+                    shell = _get_wscript_shell()
+                if shell is not None:
+                    shortcut = shell.CreateShortcut(str(shortcut_path))
+                    shortcut.TargetPath = str(target_path)
+                    shortcut.WorkingDirectory = str(target_path.parent)
+                    shortcut.Description = description
+                    if icon_location:
+                        shortcut.IconLocation = icon_location
+                    shortcut.Save()
+                    return True
+            except Exception:
+                pass  # COM failed; fall through to ctypes / PowerShell
+            
+            # Fallback: Call IShellLink directly through ctypes (no process spawn)
+            try:
+                _create_shell_link(shortcut_path, target_path, description, icon_location)
                 return True
-            except ImportError:
+            except OSError:
                 pass
             
-            # Fallback: Use PowerShell to create shortcut
-            ps_script = f'''
-$WshShell = New-Object -comObject WScript.Shell
-$Shortcut = $WshShell.CreateShortcut("{shortcut_path}")
-$Shortcut.TargetPath = "{target_path}"
-$Shortcut.WorkingDirectory = "{target_path.parent}"
-$Shortcut.Description = "{description}"
-$Shortcut.Save()
-'''
-            creationflags = subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+            # Last resort: Use PowerShell to create shortcut
+            import subprocess
+            env = dict(os.environ,
+                       PL_LNK_PATH=str(shortcut_path),
+                       PL_LNK_TARGET=str(target_path),
+                       PL_LNK_WORKDIR=str(target_path.parent),
+                       PL_LNK_DESC=description,
+                       PL_LNK_ICON=icon_location or "")
             result = subprocess.run(
-                ["powershell", "-NoProfile", "-Command", ps_script],
-                capture_output=True,
-                creationflags=creationflags
+                ["powershell", "-NoProfile", "-NonInteractive", "-ExecutionPolicy", "Bypass",
+                 "-Command", _PS_SHORTCUT_SCRIPT],
+                env=env,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                startupinfo=_hidden_startupinfo(),
+                creationflags=_HIDDEN_CREATIONFLAGS
             )
             return result.returncode == 0
             
@@ -112,6 +302,31 @@ $Shortcut.Save()
             print(f"Error creating shortcut: {e}")
             return False
     
+    def _create_shortcuts_batch(self, specs: list,
+                                icon_path: Optional[Path] = None) -> list:
+        """
+        Create several shortcuts with a single WScript.Shell instance.
+        
+        Args:
+            specs: List of (shortcut_path, target_path, description) tuples
+            icon_path: Optional icon shared by all shortcuts
+            
+        Returns:
+            List of per-shortcut success flags
+        """
+        # One stat for the whole batch instead of one per shortcut
+        icon_location = str(icon_path) if icon_path and icon_path.exists() else None
+        
+        shell = None
+        if _win32com_client() is not None:
+            try:
+                shell = _get_wscript_shell()
+            except Exception:
+                pass  # _create_shortcut falls back to ctypes / PowerShell
+        
+        return [self._create_shortcut(*spec, icon_location=icon_location, shell=shell)
+                for spec in specs]
+    
     def _remove_shortcut(self, shortcut_path: Path) -> bool:
         """Remove a Windows shortcut file."""
         try:
@@ -124,50 +339,112 @@ $Shortcut.Save()
     
     def _cleanup_legacy_startup(self) -> None:
         """Remove old startup methods (Registry, VBS files, Task Scheduler)."""
+        # Legacy entries only need removing once per installation
+        if self._legacy_cleaned:
+            return
+        
+        marker = self.get_install_dir() / _LEGACY_CLEANED_MARKER
+        if marker.exists():
+            self._legacy_cleaned = True
+            return
+        
+        # Each step is best effort, but the cleanup is only recorded as done
+        # when all of them succeed so a failed step is retried next time
+        cleaned = True
+        
+        # Remove Task Scheduler entry first; if that needs schtasks.exe it
+        # keeps running while the other entries are removed
+        task_proc = None
+        try:
+            task_proc = self._delete_legacy_task()
+        except Exception:
+            cleaned = False
+        
         # Remove old VBS from Startup folder
         try:
             vbs_path = self._get_startup_folder() / "ProjectLauncher.vbs"
             if vbs_path.exists():
                 vbs_path.unlink()
         except Exception:
-            pass
+            cleaned = False
         
         # Remove Registry entry if exists
         try:
             import winreg
-            key = winreg.OpenKey(
+            with winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER,
                 r"Software\Microsoft\Windows\CurrentVersion\Run",
                 0,
                 winreg.KEY_SET_VALUE
-            )
-            try:
-                winreg.DeleteValue(key, "ProjectLauncher")
-            except FileNotFoundError:
-                pass
-            winreg.CloseKey(key)
+            ) as key:
+                try:
+                    winreg.DeleteValue(key, "ProjectLauncher")
+                except FileNotFoundError:
+                    pass
+        except FileNotFoundError:
+            pass  # No Run key at all
         except Exception:
-            pass
+            cleaned = False
+        
+        # schtasks exits non-zero both on failure and when the task is
+        # already gone, and its output is discarded, so only a failure to
+        # run it counts against the cleanup
+        if task_proc is not None:
+            try:
+                task_proc.wait()
+            except Exception:
+                cleaned = False
+        
+        if not cleaned:
+            return
         
-        # Remove Task Scheduler entry (best effort)
+        self._legacy_cleaned = True
         try:
-            creationflags = subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-            subprocess.run(
+            marker.touch(exist_ok=True)
+        except OSError:
+            pass  # Install dir doesn't exist when running portable
+    
+    def _delete_legacy_task(self) -> Optional["subprocess.Popen"]:
+        """
+        Delete the legacy Task Scheduler entry.
+        
+        Returns the schtasks process if one had to be spawned (the caller
+        waits on it), or None if the task was removed in-process.
+        """
+        # Try the in-process Task Scheduler COM API first (no process spawn)
+        client = _win32com_client()
+        if client is None:
+            # Fallback: Use schtasks.exe
+            import subprocess
+            return subprocess.Popen(
                 ["schtasks", "/delete", "/tn", "ProjectLauncher", "/f"],
-                capture_output=True,
-                creationflags=creationflags
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                startupinfo=_hidden_startupinfo(),
+                creationflags=_HIDDEN_CREATIONFLAGS
             )
-        except Exception:
-            pass
+        
+        scheduler = client.Dispatch("Schedule.Service")
+        scheduler.Connect()
+        try:
+            scheduler.GetFolder("\\").DeleteTask("ProjectLauncher", 0)
+        except Exception as e:
+            if not _is_not_found_error(e):
+                raise
+            # Task does not exist
+        return None
     
     # =========================================================================
     # Installation
     # =========================================================================
     
+    @lru_cache(maxsize=1)
     def get_install_dir(self) -> Path:
         """Windows: Install to LocalAppData."""
         return Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local")) / "ProjectLauncher"
     
+    @lru_cache(maxsize=1)
     def get_installed_exe_path(self) -> Path:
         """Windows: Return .exe path."""
         return self.get_install_dir() / "ProjectLauncher.exe"
@@ -176,78 +453,115 @@ $Shortcut.Save()
     # Startup
     # =========================================================================
     
+    @ttl_cache(seconds=2)
     def is_startup_enabled(self) -> bool:
         """Check if Windows startup is enabled."""
-        shortcut_path = self._get_startup_folder() / "ProjectLauncher.lnk"
-        return shortcut_path.exists()
+        return os.path.exists(self._get_startup_folder() / _STARTUP_SHORTCUT_NAME)
     
     def set_startup_enabled(self, enabled: bool) -> bool:
         """Enable or disable Windows startup."""
+        self._invalidate_cached_checks()
         if enabled:
             self._cleanup_legacy_startup()
             
             exe_path = self._get_executable_path()
-            if not exe_path.exists():
+            if not self._executable_exists():
                 return False
             
             startup_folder = self._get_startup_folder()
             startup_folder.mkdir(parents=True, exist_ok=True)
             
-            shortcut_path = startup_folder / "ProjectLauncher.lnk"
+            shortcut_path = startup_folder / _STARTUP_SHORTCUT_NAME
             return self._create_shortcut(shortcut_path, exe_path, "Project Launcher - Launch your projects")
         else:
             self._cleanup_legacy_startup()
-            shortcut_path = self._get_startup_folder() / "ProjectLauncher.lnk"
+            shortcut_path = self._get_startup_folder() / _STARTUP_SHORTCUT_NAME
             return self._remove_shortcut(shortcut_path)
     
     def get_startup_location(self) -> str:
         """Get Windows startup shortcut path."""
-        return str(self._get_startup_folder() / "ProjectLauncher.lnk")
+        return str(self._get_startup_folder() / _STARTUP_SHORTCUT_NAME)
     
     # =========================================================================
     # Shortcuts
     # =========================================================================
     
+    @ttl_cache(seconds=2)
     def has_desktop_shortcut(self) -> bool:
-        shortcut_path = self._get_desktop_folder() / "Project Launcher.lnk"
+        shortcut_path = self._get_desktop_folder() / _SHORTCUT_NAME
         return shortcut_path.exists()
     
     def create_desktop_shortcut(self) -> bool:
+        self._invalidate_cached_checks()
         exe_path = self._get_executable_path()
-        if not exe_path.exists():
+        if not self._executable_exists():
             return False
         
         desktop = self._get_desktop_folder()
-        shortcut_path = desktop / "Project Launcher.lnk"
+        shortcut_path = desktop / _SHORTCUT_NAME
         return self._create_shortcut(shortcut_path, exe_path, "Project Launcher")
     
     def remove_desktop_shortcut(self) -> bool:
-        shortcut_path = self._get_desktop_folder() / "Project Launcher.lnk"
+        self._invalidate_cached_checks()
+        shortcut_path = self._get_desktop_folder() / _SHORTCUT_NAME
         return self._remove_shortcut(shortcut_path)
     
+    @ttl_cache(seconds=2)
     def has_start_menu_shortcut(self) -> bool:
-        shortcut_path = self._get_start_menu_folder() / "Project Launcher.lnk"
+        shortcut_path = self._get_start_menu_folder() / _SHORTCUT_NAME
         return shortcut_path.exists()
     
     def create_start_menu_shortcut(self) -> bool:
+        self._invalidate_cached_checks()
         exe_path = self._get_executable_path()
-        if not exe_path.exists():
+        if not self._executable_exists():
             return False
         
         start_menu = self._get_start_menu_folder()
         start_menu.mkdir(parents=True, exist_ok=True)
         
-        shortcut_path = start_menu / "Project Launcher.lnk"
+        shortcut_path = start_menu / _SHORTCUT_NAME
         return self._create_shortcut(shortcut_path, exe_path, "Project Launcher")
     
     def remove_start_menu_shortcut(self) -> bool:
-        shortcut_path = self._get_start_menu_folder() / "Project Launcher.lnk"
+        self._invalidate_cached_checks()
+        shortcut_path = self._get_start_menu_folder() / _SHORTCUT_NAME
         return self._remove_shortcut(shortcut_path)
     
     # =========================================================================
     # Install/Uninstall
     # =========================================================================
     
+    def _create_install_shortcuts(self, create_desktop: bool, create_start_menu: bool,
+                                  create_startup: bool) -> None:
+        """Create the shortcuts requested at install time in one batch."""
+        self._invalidate_cached_checks()
+        if not self._executable_exists():
+            return
+        
+        exe_path = self._get_executable_path()
+        specs = []
+        
+        if create_desktop:
+            specs.append((self._get_desktop_folder() / _SHORTCUT_NAME, exe_path, "Project Launcher"))
+        
+        if create_start_menu:
+            start_menu = self._get_start_menu_folder()
+            start_menu.mkdir(parents=True, exist_ok=True)
+            specs.append((start_menu / _SHORTCUT_NAME, exe_path, "Project Launcher"))
+        
+        if create_startup:
+            self._cleanup_legacy_startup()
+            startup_folder = self._get_startup_folder()
+            startup_folder.mkdir(parents=True, exist_ok=True)
+            specs.append((startup_folder / _STARTUP_SHORTCUT_NAME, exe_path,
+                          "Project Launcher - Launch your projects"))
+        
+        if specs:
+            # Written into the install dir by install_application's asset sync
+            icon_path = self.get_install_dir() / "assets" / "icon.ico"
+            self._create_shortcuts_batch(specs, icon_path=icon_path)
+    
     def install_application(self, create_desktop: bool, create_start_menu: bool, 
                             create_startup: bool) -> dict:
         """Install the application on Windows."""
@@ -265,12 +579,7 @@ $Shortcut.Save()
                 result["success"] = True
                 result["install_path"] = str(target_exe)
                 
-                if create_desktop:
-                    self.create_desktop_shortcut()
-                if create_start_menu:
-                    self.create_start_menu_shortcut()
-                if create_startup:
-                    self.set_startup_enabled(True)
+                self._create_install_shortcuts(create_desktop, create_start_menu, create_startup)
                 
                 return result
             except ValueError:
@@ -286,21 +595,13 @@ $Shortcut.Save()
             current_dir = current_exe.parent
             assets_dir = current_dir / "assets"
             if assets_dir.exists():
-                target_assets = install_dir / "assets"
-                if target_assets.exists():
-                    shutil.rmtree(target_assets)
-                shutil.copytree(assets_dir, target_assets)
+                self._sync_dir(assets_dir, install_dir / "assets")
             
             result["success"] = True
             result["install_path"] = str(target_exe)
             
             # Create shortcuts
-            if create_desktop:
-                self.create_desktop_shortcut()
-            if create_start_menu:
-                self.create_start_menu_shortcut()
-            if create_startup:
-                self.set_startup_enabled(True)
+            self._create_install_shortcuts(create_desktop, create_start_menu, create_startup)
             
         except Exception as e:
             result["error"] = str(e)
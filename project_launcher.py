@@ -1200,6 +1200,7 @@ class App:
         log(f"Config loaded ({len(self.config.get('projects', []))} projects)")
         self.cards = []
         self.update_info = None  # Store update info if available
+        self._update_cancel = threading.Event()  # Set on quit to drop a late update result
         
         # System tray
         self.tray_icon = None
@@ -1292,6 +1293,7 @@ class App:
     
     def _quit_app(self):
         """Fully quit the application."""
+        self._update_cancel.set()
         if self.tray_icon:
             self.tray_icon.stop()
         self.root.quit()
@@ -1647,12 +1649,13 @@ class App:
     def _check_updates(self):
         """Check for updates in background."""
         def on_update_check(result):
+            # Runs on the main thread (marshalled via tk_root)
             if result:
                 self.update_info = result
-                # Update UI on main thread
-                self.root.after(0, self._show_update_notification)
+                self._show_update_notification()
         
-        check_for_updates_async(on_update_check)
+        check_for_updates_async(on_update_check, cancel_event=self._update_cancel,
+                                tk_root=self.root)
     
     def _show_update_notification(self):
         """Show update notification in footer."""
@@ -15,11 +15,25 @@ import subprocess
 from pathlib import Path
 
 
+_VERSION_RE = re.compile(r'VERSION\s*=\s*["\']([^"\']+)["\']')
+_VERSION_PREFIX = 'VERSION = "'
+
+
 def get_current_version():
     """Read current version from update_checker.py."""
     update_checker = Path(__file__).parent / "update_checker.py"
     content = update_checker.read_text()
-    match = re.search(r'VERSION\s*=\s*["\']([^"\']+)["\']', content)
+    
+    # Fast path: the canonical `VERSION = "x.y.z"` line
+    start = content.find(_VERSION_PREFIX)
+    if start >= 0:
+        start += len(_VERSION_PREFIX)
+        end = content.find('"', start)
+        if end > start:
+            return content[start:end]
+    
+    # Fallback for single quotes or unusual spacing
+    match = _VERSION_RE.search(content)
     if match:
         return match.group(1)
     return None
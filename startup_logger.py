@@ -5,9 +5,10 @@ Uses only standard library to avoid import overhead.
 """
 
 import os
+import shutil
 import sys
 import time
-from datetime import datetime
+from collections import deque
 from pathlib import Path
 
 # Store start time immediately when module is imported
@@ -19,6 +20,7 @@ _is_auto_startup = False
 # Maximum number of startup sessions to keep in log
 MAX_SESSIONS = 10
 SESSION_SEPARATOR = "=" * 60
+_SEPARATOR_BYTES = SESSION_SEPARATOR.encode("ascii")
 
 
 def _get_log_path() -> Path:
@@ -39,29 +41,40 @@ def _rotate_log(log_path: Path) -> None:
         return
     
     try:
-        with open(log_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        
-        # Split by session separator
-        sessions = content.split(SESSION_SEPARATOR)
-        
-        # Filter out empty sessions and keep last MAX_SESSIONS
-        sessions = [s.strip() for s in sessions if s.strip()]
-        if len(sessions) > MAX_SESSIONS:
-            sessions = sessions[-MAX_SESSIONS:]
+        # Stream the file line by line, remembering only the offsets of the
+        # last MAX_SESSIONS separators instead of loading every session
+        offsets = deque(maxlen=MAX_SESSIONS)
+        total = 0
+        pos = 0
+        with open(log_path, "rb") as f:
+            for line in f:
+                if line.rstrip(b"\r\n") == _SEPARATOR_BYTES:
+                    offsets.append(pos)
+                    total += 1
+                pos += len(line)
             
-            # Rewrite file with only recent sessions
-            with open(log_path, "w", encoding="utf-8") as f:
-                f.write(f"\n{SESSION_SEPARATOR}\n".join(sessions))
-                f.write(f"\n{SESSION_SEPARATOR}\n")
+            if total <= MAX_SESSIONS:
+                return
+            
+            # Copy only the tail and swap it into place
+            tmp_path = log_path.with_suffix(".log.tmp")
+            f.seek(offsets[0])
+            with open(tmp_path, "wb") as tmp:
+                shutil.copyfileobj(f, tmp, 65536)
+        
+        os.replace(tmp_path, log_path)
     except Exception:
         # If rotation fails, just continue - logging shouldn't break the app
         pass
 
 
 def _timestamp() -> str:
-    """Get current timestamp string."""
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+    """Get current timestamp string (local time, millisecond precision)."""
+    t = time.time()
+    lt = time.localtime(t)
+    ms = int((t - int(t)) * 1000)
+    return (f"{lt.tm_year:04d}-{lt.tm_mon:02d}-{lt.tm_mday:02d} "
+            f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}.{ms:03d}")
 
 
 def _elapsed() -> str:
@@ -88,13 +101,16 @@ def start_session(auto: bool = False) -> None:
     _rotate_log(log_path)
     
     try:
-        _log_file = open(log_path, "a", encoding="utf-8")
+        # Unbuffered binary append: each line is pre-encoded and lands in
+        # a single write() without going through the text IO layer
+        _log_file = open(log_path, "ab", buffering=0)
         
         startup_type = "auto-startup" if auto else "manual"
-        _log_file.write(f"\n{SESSION_SEPARATOR}\n")
-        _log_file.write(f"[{_timestamp()}] === Startup Begin ({startup_type}) ===\n")
-        _log_file.write(f"[{_timestamp()}] [+{_elapsed()}] Python interpreter ready\n")
-        _log_file.flush()
+        _log_file.write(
+            f"\n{SESSION_SEPARATOR}\n"
+            f"[{_timestamp()}] === Startup Begin ({startup_type}) ===\n"
+            f"[{_timestamp()}] [+{_elapsed()}] Python interpreter ready\n".encode("utf-8", errors="replace")
+        )
     except Exception:
         _log_file = None
 
@@ -110,8 +126,7 @@ def log(message: str) -> None:
         return
     
     try:
-        _log_file.write(f"[{_timestamp()}] [+{_elapsed()}] {message}\n")
-        _log_file.flush()
+        _log_file.write(f"[{_timestamp()}] [+{_elapsed()}] {message}\n".encode("utf-8", errors="replace"))
     except Exception:
         pass
 
@@ -125,8 +140,9 @@ def end_session() -> None:
     
     try:
         total_ms = (time.perf_counter() - _session_start) * 1000 if _session_start else 0
-        _log_file.write(f"[{_timestamp()}] === Startup Complete: {total_ms:.0f}ms ({total_ms/1000:.2f}s) ===\n")
-        _log_file.flush()
+        _log_file.write(
+            f"[{_timestamp()}] === Startup Complete: {total_ms:.0f}ms ({total_ms/1000:.2f}s) ===\n".encode("utf-8", errors="replace")
+        )
         _log_file.close()
     except Exception:
         pass
@@ -144,8 +160,8 @@ def log_vbs_timestamp(message: str) -> None:
     log_path = _get_log_path()
     
     try:
-        with open(log_path, "a", encoding="utf-8") as f:
-            f.write(f"[{_timestamp()}] [VBS] {message}\n")
+        with open(log_path, "ab", buffering=0) as f:
+            f.write(f"[{_timestamp()}] [VBS] {message}\n".encode("utf-8", errors="replace"))
     except Exception:
         pass
 
@@ -7,26 +7,31 @@ platform_handlers architecture internally.
 """
 
 import sys
-import platform
 from pathlib import Path
 
-from platform_handlers import get_platform_handler
+from platform_handlers import get_platform_handler, get_platform_name
+
+# Platform never changes for the lifetime of the process
+_PLATFORM = get_platform_name()
+_IS_DARWIN = _PLATFORM == "Darwin"
+
+# Handler for the current platform, resolved once at import
+_HANDLER = get_platform_handler()
 
 
 def get_platform() -> str:
     """Get the current platform name."""
-    return platform.system()
+    return _PLATFORM
 
 
 def get_executable_path() -> Path:
     """Get the path to the running executable or script."""
-    handler = get_platform_handler()
-    return handler._get_executable_path()
+    return _HANDLER._get_executable_path()
 
 
 def get_app_bundle_path() -> Path | None:
     """Get the .app bundle path on macOS, or None if not in a bundle."""
-    if get_platform() != "Darwin" or not getattr(sys, 'frozen', False):
+    if not _IS_DARWIN or not getattr(sys, 'frozen', False):
         return None
     
     exe_path = Path(sys.executable)
@@ -39,8 +44,7 @@ def get_app_bundle_path() -> Path | None:
 
 def get_install_dir() -> Path:
     """Get the installation directory."""
-    handler = get_platform_handler()
-    return handler.get_install_dir()
+    return _HANDLER.get_install_dir()
 
 
 def is_installed() -> bool:
@@ -57,8 +61,7 @@ def is_installed() -> bool:
 
 def get_installed_exe_path() -> Path:
     """Get the path where the exe/app should be installed."""
-    handler = get_platform_handler()
-    return handler.get_installed_exe_path()
+    return _HANDLER.get_installed_exe_path()
 
 
 # =============================================================================
@@ -67,38 +70,32 @@ def get_installed_exe_path() -> Path:
 
 def create_desktop_shortcut() -> bool:
     """Create a desktop shortcut."""
-    handler = get_platform_handler()
-    return handler.create_desktop_shortcut()
+    return _HANDLER.create_desktop_shortcut()
 
 
 def remove_desktop_shortcut() -> bool:
     """Remove desktop shortcut."""
-    handler = get_platform_handler()
-    return handler.remove_desktop_shortcut()
+    return _HANDLER.remove_desktop_shortcut()
 
 
 def has_desktop_shortcut() -> bool:
     """Check if desktop shortcut exists."""
-    handler = get_platform_handler()
-    return handler.has_desktop_shortcut()
+    return _HANDLER.has_desktop_shortcut()
 
 
 def create_start_menu_shortcut() -> bool:
     """Create a Start Menu shortcut."""
-    handler = get_platform_handler()
-    return handler.create_start_menu_shortcut()
+    return _HANDLER.create_start_menu_shortcut()
 
 
 def remove_start_menu_shortcut() -> bool:
     """Remove Start Menu shortcut."""
-    handler = get_platform_handler()
-    return handler.remove_start_menu_shortcut()
+    return _HANDLER.remove_start_menu_shortcut()
 
 
 def has_start_menu_shortcut() -> bool:
     """Check if Start Menu shortcut exists."""
-    handler = get_platform_handler()
-    return handler.has_start_menu_shortcut()
+    return _HANDLER.has_start_menu_shortcut()
 
 
 # =============================================================================
@@ -115,8 +112,7 @@ def set_startup_enabled(enabled: bool) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    handler = get_platform_handler()
-    return handler.set_startup_enabled(enabled)
+    return _HANDLER.set_startup_enabled(enabled)
 
 
 def is_startup_enabled() -> bool:
@@ -126,8 +122,7 @@ def is_startup_enabled() -> bool:
     Returns:
         True if enabled, False otherwise
     """
-    handler = get_platform_handler()
-    return handler.is_startup_enabled()
+    return _HANDLER.is_startup_enabled()
 
 
 def get_startup_location() -> str:
@@ -137,8 +132,7 @@ def get_startup_location() -> str:
     Returns:
         Path string to the startup file/folder
     """
-    handler = get_platform_handler()
-    return handler.get_startup_location()
+    return _HANDLER.get_startup_location()
 
 
 # =============================================================================
@@ -155,8 +149,7 @@ def install_application(create_desktop: bool = True, create_start_menu: bool = T
         - install_path: str (path where installed)
         - error: str (if failed)
     """
-    handler = get_platform_handler()
-    return handler.install_application(create_desktop, create_start_menu, create_startup)
+    return _HANDLER.install_application(create_desktop, create_start_menu, create_startup)
 
 
 def uninstall_application(remove_app: bool = False, remove_config: bool = False) -> dict:
@@ -171,8 +164,7 @@ def uninstall_application(remove_app: bool = False, remove_config: bool = False)
         - success: bool
         - error: str (if failed)
     """
-    handler = get_platform_handler()
-    return handler.uninstall_application(remove_app, remove_config)
+    return _HANDLER.uninstall_application(remove_app, remove_config)
 
 
 # =============================================================================
@@ -0,0 +1,95 @@
+"""
+Tests for the Windows handler's one-time legacy startup cleanup.
+
+pywin32 and winreg are replaced with small fakes so these run anywhere.
+"""
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from platform_handlers import windows
+from platform_handlers.windows import WindowsPlatformHandler, _LEGACY_CLEANED_MARKER
+
+DISP_E_EXCEPTION = -2147352567
+HRESULT_FILE_NOT_FOUND = -2147024894  # 0x80070002
+E_ACCESSDENIED = -2147024891  # 0x80070005
+
+
+class FakeComError(Exception):
+    """Mimics pywintypes.com_error(hresult, strerror, excepinfo, argerror)."""
+
+    def __init__(self, hresult, strerror, excepinfo, argerror):
+        super().__init__(hresult, strerror, excepinfo, argerror)
+        self.hresult = hresult
+        self.strerror = strerror
+        self.excepinfo = excepinfo
+        self.argerror = argerror
+
+
+def _fake_win32com_client(delete_error):
+    """win32com.client stand-in whose DeleteTask raises delete_error."""
+    folder = mock.Mock()
+    folder.DeleteTask.side_effect = delete_error
+    scheduler = mock.Mock()
+    scheduler.GetFolder.return_value = folder
+    return types.SimpleNamespace(Dispatch=mock.Mock(return_value=scheduler))
+
+
+def _fake_winreg():
+    """winreg stand-in with an empty Run key."""
+    key = mock.MagicMock()
+    key.__enter__.return_value = key
+    return types.SimpleNamespace(
+        HKEY_CURRENT_USER=object(),
+        KEY_SET_VALUE=0,
+        OpenKey=mock.Mock(return_value=key),
+        DeleteValue=mock.Mock(side_effect=FileNotFoundError),
+    )
+
+
+class LegacyCleanupTests(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.install_dir = Path(tmp.name)
+
+        patches = [
+            mock.patch.object(WindowsPlatformHandler, "get_install_dir",
+                              return_value=self.install_dir),
+            mock.patch.object(WindowsPlatformHandler, "_get_startup_folder",
+                              return_value=self.install_dir / "Startup"),
+            mock.patch.dict(sys.modules, {"winreg": _fake_winreg()}),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _run_cleanup(self, delete_error):
+        client = _fake_win32com_client(delete_error)
+        with mock.patch.object(windows, "_win32com_client", return_value=client):
+            WindowsPlatformHandler()._cleanup_legacy_startup()
+        return self.install_dir / _LEGACY_CLEANED_MARKER
+
+    def test_missing_task_reported_via_excepinfo_writes_marker(self):
+        error = FakeComError(DISP_E_EXCEPTION, "Exception occurred.",
+                             (0, None, None, None, 0, HRESULT_FILE_NOT_FOUND), None)
+        self.assertTrue(self._run_cleanup(error).exists())
+
+    def test_missing_task_reported_via_hresult_writes_marker(self):
+        error = FakeComError(HRESULT_FILE_NOT_FOUND, "Not found", None, None)
+        self.assertTrue(self._run_cleanup(error).exists())
+
+    def test_other_task_error_leaves_marker_unwritten(self):
+        error = FakeComError(DISP_E_EXCEPTION, "Exception occurred.",
+                             (0, None, None, None, 0, E_ACCESSDENIED), None)
+        self.assertFalse(self._run_cleanup(error).exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,9 +2,42 @@
 Project Card - Project list item component
 """
 import tkinter as tk
+from functools import lru_cache
 from app.theme import Theme
 from ui.widgets import ActionButton
 
+# Font tuples shared by every card
+_FONT_9 = Theme.font(9)
+_FONT_11_BOLD = Theme.font(11, bold=True)
+
+
+@lru_cache(maxsize=512)
+def _derive_display(path, action_keys):
+    """
+    Compute the truncated path and actions summary shown on a card.
+    
+    Args:
+        path: Project path
+        action_keys: Tuple of (type, ide, tool) for each project action
+    """
+    if len(path) > 50:
+        path = "..." + path[-47:]
+    
+    parts = []
+    for t, ide, tool in action_keys:
+        if t == "ide":
+            parts.append(ide)
+        elif t == "vscode":
+            parts.append("code")
+        elif t == "ai_tool":
+            parts.append(tool)
+        elif t == "terminal":
+            parts.append("term")
+        elif t == "browser":
+            parts.append("browser")
+    
+    return path, " · ".join(parts)
+
 
 class ProjectCard(tk.Frame):
     """Project list item."""
@@ -32,22 +65,24 @@ class ProjectCard(tk.Frame):
         self.name_lbl = tk.Label(
             left,
             text=self.project.get("name", "Untitled"),
-            font=Theme.font(11, bold=True),
+            font=_FONT_11_BOLD,
             fg=Theme.FG_BRIGHT,
             bg=Theme.BG_CARD,
             anchor="w"
         )
         self.name_lbl.pack(anchor="w")
         
-        # Path
-        path = self.project.get("path", "")
-        if len(path) > 50:
-            path = "..." + path[-47:]
+        # Path and actions summary (cached across list rebuilds)
+        action_keys = tuple(
+            (a.get("type"), a.get("ide", "vscode"), a.get("tool", ""))
+            for a in self.project.get("actions", [])
+        )
+        path, tags = _derive_display(self.project.get("path", ""), action_keys)
         
         self.path_lbl = tk.Label(
             left,
             text=path,
-            font=Theme.font(9),
+            font=_FONT_9,
             fg=Theme.FG_DIM,
             bg=Theme.BG_CARD,
             anchor="w"
@@ -55,28 +90,11 @@ class ProjectCard(tk.Frame):
         self.path_lbl.pack(anchor="w", pady=(2, 0))
         
         # Actions summary
-        actions = self.project.get("actions", [])
-        parts = []
-        for a in actions:
-            t = a.get("type")
-            if t == "ide":
-                ide = a.get("ide", "vscode")
-                parts.append(ide)
-            elif t == "vscode":
-                parts.append("code")
-            elif t == "ai_tool":
-                tool = a.get("tool", "")
-                parts.append(tool)
-            elif t == "terminal":
-                parts.append("term")
-            elif t == "browser":
-                parts.append("browser")
-        
-        if parts:
+        if tags:
             self.tags_lbl = tk.Label(
                 left,
-                text=" · ".join(parts),
-                font=Theme.font(9),
+                text=tags,
+                font=_FONT_9,
                 fg=Theme.FG_DIM,
                 bg=Theme.BG_CARD
             )
@@ -98,14 +116,17 @@ class ProjectCard(tk.Frame):
         delete_btn.pack(side=tk.LEFT, padx=(4, 0))
         self.action_buttons.append(delete_btn)
         
+        # Widgets recolored on hover, collected once so hovering doesn't
+        # walk the widget tree (action buttons update themselves)
+        hover_widgets = [self, left, self.name_lbl, self.path_lbl]
+        if hasattr(self, 'tags_lbl'):
+            hover_widgets.append(self.tags_lbl)
+        self._bg_widgets = hover_widgets + [right]
+        
         # Hover effect on card (visual only, no click action)
-        for w in [self, left, self.name_lbl, self.path_lbl]:
+        for w in hover_widgets:
             w.bind("<Enter>", self._on_enter)
             w.bind("<Leave>", self._on_leave)
-        
-        if hasattr(self, 'tags_lbl'):
-            self.tags_lbl.bind("<Enter>", self._on_enter)
-            self.tags_lbl.bind("<Leave>", self._on_leave)
     
     def _on_enter(self, e):
         self._set_bg(Theme.BG_CARD_HOVER)
@@ -114,22 +135,12 @@ class ProjectCard(tk.Frame):
         self._set_bg(Theme.BG_CARD)
     
     def _set_bg(self, c):
-        self.config(bg=c)
-        for w in self.winfo_children():
-            self._update_child_bg(w, c)
+        for w in self._bg_widgets:
+            w.config(bg=c)
         # Update action buttons
         for btn in self.action_buttons:
             btn.update_bg(c)
     
-    def _update_child_bg(self, w, c):
-        try:
-            if not isinstance(w, (ActionButton,)):
-                w.config(bg=c)
-            for child in w.winfo_children():
-                self._update_child_bg(child, c)
-        except:
-            pass
-    
     def _do_launch(self):
         self.on_launch_cb(self.index)
     
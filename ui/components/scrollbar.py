@@ -29,10 +29,35 @@ class CustomScrollbar(tk.Canvas):
         self._dragging = False
         self._drag_start_y = 0
         self._drag_start_pos = 0
+        self._drag_scale = 0.0  # Fraction per pixel, fixed for the drag
+        self._drag_max_pos = 0.0  # Furthest the thumb start can move
         self._thumb_id = None
+        self._height = 1  # Cached from <Configure> to avoid winfo_height() calls
+        self._redraw_id = None  # Pending after_idle redraw from set()
+        self._last_draw = None  # (start, end, color) of the thumb on screen
         self._visible = False
         self._hover = False
         
+        # Thumb geometry: x values and radius depend only on the width, so the
+        # rounded-rect point list is built once and only its y slots rewritten
+        self._padding = 2
+        self._radius = (self.width - self._padding * 2) // 2
+        x1, x2, r = self._padding, self.width - self._padding, self._radius
+        self._points = [
+            x1 + r, 0,
+            x2 - r, 0,
+            x2, 0,
+            x2, 0,
+            x2, 0,
+            x2, 0,
+            x2 - r, 0,
+            x1 + r, 0,
+            x1, 0,
+            x1, 0,
+            x1, 0,
+            x1, 0,
+        ]
+        
         # Bind events
         self.bind("<Configure>", self._on_configure)
         self.bind("<Enter>", self._on_enter)
@@ -44,21 +69,40 @@ class CustomScrollbar(tk.Canvas):
     def set(self, first, last):
         """Set the scrollbar position (called by scrollable widget)."""
         first, last = float(first), float(last)
+        if first == self._thumb_pos[0] and last == self._thumb_pos[1]:
+            return  # Nothing moved
         self._thumb_pos = [first, last]
         
         # Check if scrollbar should be visible
-        self._visible = (last - first) < 1.0
+        visible = (last - first) < 1.0
+        if not visible and not self._visible:
+            return  # Still hidden; nothing to redraw
+        self._visible = visible
+        
+        # Coalesce bursts of scroll updates into one redraw per idle cycle
+        if self._redraw_id is None:
+            self._redraw_id = self.after_idle(self._flush_redraw)
+        
+    def _flush_redraw(self):
+        """Run the redraw scheduled by set()."""
+        self._redraw_id = None
         self._draw_thumb()
         
-    def _draw_thumb(self):
-        """Draw the scrollbar thumb."""
-        self.delete("thumb")
+    def destroy(self):
+        """Cancel any pending redraw before the canvas goes away."""
+        if self._redraw_id is not None:
+            self.after_cancel(self._redraw_id)
+            self._redraw_id = None
+        super().destroy()
         
-        if not self._visible:
-            return
-            
-        height = self.winfo_height()
-        if height <= 1:
+    def _draw_thumb(self):
+        """Draw the scrollbar thumb, moving the existing item when there is one."""
+        height = self._height
+        if not self._visible or height <= 1:
+            if self._thumb_id is not None:
+                self.delete(self._thumb_id)
+                self._thumb_id = None
+                self._last_draw = None
             return
             
         # Calculate thumb position and size
@@ -73,40 +117,42 @@ class CustomScrollbar(tk.Canvas):
                 thumb_end = height
                 thumb_start = height - 30
         
-        # Draw rounded rectangle thumb with padding
-        padding = 2
-        radius = (self.width - padding * 2) // 2
-        
-        self._thumb_id = self._create_rounded_rect(
-            padding,
-            thumb_start + padding,
-            self.width - padding,
-            thumb_end - padding,
-            radius,
-            fill=self._current_thumb_color,
-            tags="thumb"
-        )
-        
-    def _create_rounded_rect(self, x1, y1, x2, y2, radius, **kwargs):
-        """Create a rounded rectangle."""
-        points = [
-            x1 + radius, y1,
-            x2 - radius, y1,
-            x2, y1,
-            x2, y1 + radius,
-            x2, y2 - radius,
-            x2, y2,
-            x2 - radius, y2,
-            x1 + radius, y2,
-            x1, y2,
-            x1, y2 - radius,
-            x1, y1 + radius,
-            x1, y1,
-        ]
-        return self.create_polygon(points, smooth=True, **kwargs)
+        # Same pixels and color as what's already drawn - nothing to do
+        draw_key = (thumb_start, thumb_end, self._current_thumb_color)
+        if draw_key == self._last_draw:
+            return
+        self._last_draw = draw_key
+        
+        # Fill in the y values of the rounded rectangle, inset by the padding
+        y1 = thumb_start + self._padding
+        y2 = thumb_end - self._padding
+        r = self._radius
+        if r > 0:
+            points = self._points
+            points[1] = points[3] = points[5] = points[23] = y1
+            points[7] = points[21] = y1 + r
+            points[9] = points[19] = y2 - r
+            points[11] = points[13] = points[15] = points[17] = y2
+        else:
+            # Too thin to round; a plain rectangle is Tk's cheapest item
+            points = (self._padding, y1, self.width - self._padding, y2)
+        
+        if self._thumb_id is None:
+            if r > 0:
+                self._thumb_id = self.create_polygon(
+                    points, smooth=True, fill=self._current_thumb_color, tags="thumb"
+                )
+            else:
+                self._thumb_id = self.create_rectangle(
+                    points, fill=self._current_thumb_color, outline="", tags="thumb"
+                )
+        else:
+            self.coords(self._thumb_id, *points)
+            self.itemconfigure(self._thumb_id, fill=self._current_thumb_color)
         
     def _on_configure(self, event):
         """Handle resize."""
+        self._height = event.height
         self._draw_thumb()
         
     def _on_enter(self, event):
@@ -114,21 +160,23 @@ class CustomScrollbar(tk.Canvas):
         self._hover = True
         if not self._dragging:
             self._current_thumb_color = self.thumb_hover_color
-            self._draw_thumb()
+            if self._visible:
+                self._draw_thumb()
             
     def _on_leave(self, event):
         """Handle mouse leave."""
         self._hover = False
         if not self._dragging:
             self._current_thumb_color = self.thumb_color
-            self._draw_thumb()
+            if self._visible:
+                self._draw_thumb()
             
     def _on_click(self, event):
         """Handle click on scrollbar."""
         if not self._visible:
             return
             
-        height = self.winfo_height()
+        height = self._height
         thumb_start = int(self._thumb_pos[0] * height)
         thumb_end = int(self._thumb_pos[1] * height)
         
@@ -137,6 +185,8 @@ class CustomScrollbar(tk.Canvas):
             self._dragging = True
             self._drag_start_y = event.y
             self._drag_start_pos = self._thumb_pos[0]
+            self._drag_scale = 1.0 / max(height, 1)
+            self._drag_max_pos = 1.0 - (self._thumb_pos[1] - self._thumb_pos[0])
             self._current_thumb_color = self.thumb_active_color
             self._draw_thumb()
         else:
@@ -153,13 +203,11 @@ class CustomScrollbar(tk.Canvas):
         if not self._dragging or not self._visible:
             return
             
-        height = self.winfo_height()
-        delta_y = event.y - self._drag_start_y
-        delta_fraction = delta_y / height
-        
-        thumb_size = self._thumb_pos[1] - self._thumb_pos[0]
-        new_pos = self._drag_start_pos + delta_fraction
-        new_pos = max(0, min(1 - thumb_size, new_pos))
+        new_pos = self._drag_start_pos + (event.y - self._drag_start_y) * self._drag_scale
+        if new_pos < 0.0:
+            new_pos = 0.0
+        elif new_pos > self._drag_max_pos:
+            new_pos = self._drag_max_pos
         
         if self.command:
             self.command("moveto", str(new_pos))
@@ -171,4 +219,5 @@ class CustomScrollbar(tk.Canvas):
             self._current_thumb_color = self.thumb_hover_color
         else:
             self._current_thumb_color = self.thumb_color
-        self._draw_thumb()
+        if self._visible:
+            self._draw_thumb()
@@ -2,8 +2,22 @@
 UI Widgets - Reusable UI components
 """
 import tkinter as tk
+from functools import partial
 from app.theme import Theme
 
+# Font tuples shared by every widget instance
+_FONT_8 = Theme.font(8)
+_FONT_9 = Theme.font(9)
+_FONT_10 = Theme.font(10)
+_FONT_11 = Theme.font(11)
+
+
+def _share_bindings(frame, *children):
+    """Make events on children run frame's bindings, so they're bound once."""
+    tag = str(frame)
+    for child in children:
+        child.bindtags((tag,) + child.bindtags())
+
 
 class TextButton(tk.Label):
     """Simple text button with hover."""
@@ -12,7 +26,7 @@ class TextButton(tk.Label):
         super().__init__(
             parent,
             text=text,
-            font=Theme.font(10),
+            font=_FONT_10,
             fg=fg,
             cursor="hand2",
             **kwargs
@@ -21,9 +35,19 @@ class TextButton(tk.Label):
         self.fg = fg
         self.hover_fg = hover_fg
         
-        self.bind("<Enter>", lambda e: self.config(fg=self.hover_fg))
-        self.bind("<Leave>", lambda e: self.config(fg=self.fg))
-        self.bind("<Button-1>", lambda e: self.command() if self.command else None)
+        self.bind("<Enter>", self._enter)
+        self.bind("<Leave>", self._leave)
+        self.bind("<Button-1>", self._click)
+    
+    def _enter(self, e):
+        self.config(fg=self.hover_fg)
+    
+    def _leave(self, e):
+        self.config(fg=self.fg)
+    
+    def _click(self, e):
+        if self.command:
+            self.command()
 
 
 class Entry(tk.Frame):
@@ -35,7 +59,7 @@ class Entry(tk.Frame):
         self.placeholder = placeholder
         self.entry = tk.Entry(
             self,
-            font=Theme.font(10),
+            font=_FONT_10,
             bg=Theme.BG_INPUT,
             fg=Theme.FG,
             insertbackground=Theme.FG,
@@ -44,37 +68,55 @@ class Entry(tk.Frame):
         )
         self.entry.pack(fill=tk.X, padx=8, pady=6)
         
+        self._showing_placeholder = False
         if placeholder:
-            self.entry.insert(0, placeholder)
-            self.entry.config(fg=Theme.FG_DIM)
+            self._show_placeholder()
         
         self.entry.bind("<FocusIn>", self._focus_in)
         self.entry.bind("<FocusOut>", self._focus_out)
-        self.bind("<FocusIn>", lambda e: self.config(highlightbackground=Theme.ACCENT))
-        self.bind("<FocusOut>", lambda e: self.config(highlightbackground=Theme.BORDER))
+        self.bind("<FocusIn>", self._highlight)
+        self.bind("<FocusOut>", self._unhighlight)
+    
+    def _highlight(self, e):
+        self.config(highlightbackground=Theme.ACCENT)
+    
+    def _unhighlight(self, e):
+        self.config(highlightbackground=Theme.BORDER)
+    
+    def _show_placeholder(self):
+        self.entry.insert(0, self.placeholder)
+        self.entry.config(fg=Theme.FG_DIM)
+        self._showing_placeholder = True
+    
+    def _hide_placeholder(self):
+        self.entry.delete(0, tk.END)
+        self.entry.config(fg=Theme.FG)
+        self._showing_placeholder = False
     
     def _focus_in(self, e):
         self.config(highlightbackground=Theme.ACCENT)
-        if self.entry.get() == self.placeholder:
-            self.entry.delete(0, tk.END)
-            self.entry.config(fg=Theme.FG)
+        if self._showing_placeholder:
+            self._hide_placeholder()
     
     def _focus_out(self, e):
         self.config(highlightbackground=Theme.BORDER)
-        if not self.entry.get() and self.placeholder:
-            self.entry.insert(0, self.placeholder)
-            self.entry.config(fg=Theme.FG_DIM)
+        if self.placeholder and not self._showing_placeholder and not self.entry.get():
+            self._show_placeholder()
     
     def get(self):
-        v = self.entry.get()
-        return "" if v == self.placeholder else v
+        return "" if self._showing_placeholder else self.entry.get()
     
     def insert(self, i, v):
         self.entry.delete(0, tk.END)
         self.entry.insert(i, v)
         self.entry.config(fg=Theme.FG)
+        self._showing_placeholder = False
     
     def delete(self, a, b):
+        if self._showing_placeholder:
+            # Placeholder text goes too; what's left is real content
+            self.entry.config(fg=Theme.FG)
+            self._showing_placeholder = False
         self.entry.delete(a, b)
     
     def focus_set(self):
@@ -98,7 +140,7 @@ class Button(tk.Frame):
         self.label = tk.Label(
             self,
             text=text,
-            font=Theme.font(10),
+            font=_FONT_10,
             fg=Theme.FG_BRIGHT if primary else Theme.FG,
             bg=bg,
             padx=16,
@@ -106,10 +148,10 @@ class Button(tk.Frame):
         )
         self.label.pack()
         
-        for w in [self, self.label]:
-            w.bind("<Enter>", self._enter)
-            w.bind("<Leave>", self._leave)
-            w.bind("<Button-1>", self._click)
+        _share_bindings(self, self.label)
+        self.bind("<Enter>", self._enter)
+        self.bind("<Leave>", self._leave)
+        self.bind("<Button-1>", self._click)
     
     def _enter(self, e):
         self.config(bg=self.hover_bg)
@@ -140,7 +182,7 @@ class ActionButton(tk.Frame):
         self.label = tk.Label(
             self,
             text=text,
-            font=Theme.font(11),
+            font=_FONT_11,
             fg=fg,
             bg=bg,
             padx=padx,
@@ -148,10 +190,10 @@ class ActionButton(tk.Frame):
         )
         self.label.pack()
         
-        for w in [self, self.label]:
-            w.bind("<Enter>", self._enter)
-            w.bind("<Leave>", self._leave)
-            w.bind("<Button-1>", self._click)
+        _share_bindings(self, self.label)
+        self.bind("<Enter>", self._enter)
+        self.bind("<Leave>", self._leave)
+        self.bind("<Button-1>", self._click)
     
     def _enter(self, e):
         self.label.config(fg=self.hover_fg)
@@ -179,11 +221,12 @@ class ToggleButton(tk.Frame):
         self.text = text
         self._selected = selected
         self.on_toggle = on_toggle
+        self._style = None  # (bg, fg) last applied, to skip no-op configs
         
         self.label = tk.Label(
             self,
             text=text,
-            font=Theme.font(9),
+            font=_FONT_9,
             fg=Theme.FG,
             bg=Theme.BG_SECONDARY,
             padx=14,
@@ -193,10 +236,10 @@ class ToggleButton(tk.Frame):
         
         self._update_style()
         
-        for w in [self, self.label]:
-            w.bind("<Enter>", self._enter)
-            w.bind("<Leave>", self._leave)
-            w.bind("<Button-1>", self._click)
+        _share_bindings(self, self.label)
+        self.bind("<Enter>", self._enter)
+        self.bind("<Leave>", self._leave)
+        self.bind("<Button-1>", self._click)
     
     @property
     def selected(self):
@@ -204,21 +247,27 @@ class ToggleButton(tk.Frame):
     
     @selected.setter
     def selected(self, value):
+        if value == self._selected:
+            return
         self._selected = value
         self._update_style()
     
+    def _apply_style(self, bg, fg):
+        if self._style == (bg, fg):
+            return
+        self._style = (bg, fg)
+        self.config(bg=bg)
+        self.label.config(bg=bg, fg=fg)
+    
     def _update_style(self):
         if self._selected:
-            self.config(bg=Theme.ACCENT)
-            self.label.config(bg=Theme.ACCENT, fg=Theme.FG_BRIGHT)
+            self._apply_style(Theme.ACCENT, Theme.FG_BRIGHT)
         else:
-            self.config(bg=Theme.BG_SECONDARY)
-            self.label.config(bg=Theme.BG_SECONDARY, fg=Theme.FG_DIM)
+            self._apply_style(Theme.BG_SECONDARY, Theme.FG_DIM)
     
     def _enter(self, e):
         if not self._selected:
-            self.config(bg=Theme.BG_CARD_HOVER)
-            self.label.config(bg=Theme.BG_CARD_HOVER, fg=Theme.FG)
+            self._apply_style(Theme.BG_CARD_HOVER, Theme.FG)
     
     def _leave(self, e):
         self._update_style()
@@ -244,24 +293,23 @@ class ToggleButtonGroup(tk.Frame):
         if columns is None:
             columns = min(len(options), 5)
         
-        # Create grid of buttons
-        row_frame = tk.Frame(self, bg=Theme.BG)
-        row_frame.pack(fill=tk.X)
-        
+        # Create grid of buttons directly in this frame (no per-row frames)
         for i, (key, label) in enumerate(options):
-            if i > 0 and i % columns == 0:
-                row_frame = tk.Frame(self, bg=Theme.BG)
-                row_frame.pack(fill=tk.X, pady=(4, 0))
+            row, column = divmod(i, columns)
             
             btn = ToggleButton(
-                row_frame, 
+                self, 
                 label, 
                 selected=False, 
-                on_toggle=lambda t, s, k=key: self._on_toggle(k, s)
+                on_toggle=partial(self._child_toggled, key)
             )
-            btn.pack(side=tk.LEFT, padx=(0, 4))
+            btn.grid(row=row, column=column, padx=(0, 4), pady=(4 if row else 0, 0), sticky="w")
             self.buttons[key] = btn
     
+    def _child_toggled(self, key, label, selected):
+        # ToggleButton reports its label; the option key is bound per button
+        self._on_toggle(key, selected)
+    
     def _on_toggle(self, key, selected):
         if not self.multi and selected:
             # Deselect all others
@@ -275,6 +323,7 @@ class ToggleButtonGroup(tk.Frame):
     
     def set_selected(self, keys):
         """Set selected keys."""
+        keys = set(keys)
         for k, btn in self.buttons.items():
             btn.selected = k in keys
 
@@ -287,16 +336,18 @@ class Dropdown(tk.Frame):
                         highlightbackground=Theme.BORDER, cursor="hand2")
         
         self.options = options  # List of (key, label) tuples
+        self._label_by_key = dict(options)
         self.on_change = on_change
         self._selected_key = default or (options[0][0] if options else None)
+        self._menu = None  # Built on first open and reused
         
         # Find label for selected key
-        selected_label = next((l for k, l in options if k == self._selected_key), "")
+        selected_label = self._label_by_key.get(self._selected_key, "")
         
         self.label = tk.Label(
             self,
             text=selected_label,
-            font=Theme.font(10),
+            font=_FONT_10,
             fg=Theme.FG,
             bg=Theme.BG_INPUT,
             anchor="w",
@@ -308,29 +359,35 @@ class Dropdown(tk.Frame):
         self.arrow = tk.Label(
             self,
             text="▼",
-            font=Theme.font(8),
+            font=_FONT_8,
             fg=Theme.FG_DIM,
             bg=Theme.BG_INPUT,
             padx=12
         )
         self.arrow.pack(side=tk.RIGHT)
         
-        for w in [self, self.label, self.arrow]:
-            w.bind("<Button-1>", self._show_menu)
-            w.bind("<Enter>", lambda e: self.config(highlightbackground=Theme.ACCENT))
-            w.bind("<Leave>", lambda e: self.config(highlightbackground=Theme.BORDER))
+        _share_bindings(self, self.label, self.arrow)
+        self.bind("<Button-1>", self._show_menu)
+        self.bind("<Enter>", self._enter)
+        self.bind("<Leave>", self._leave)
+    
+    def _enter(self, e):
+        self.config(highlightbackground=Theme.ACCENT)
+    
+    def _leave(self, e):
+        self.config(highlightbackground=Theme.BORDER)
     
     def _show_menu(self, e):
-        menu = tk.Menu(self, tearoff=0, bg=Theme.BG_SECONDARY, fg=Theme.FG,
-                      activebackground=Theme.ACCENT, activeforeground=Theme.FG_BRIGHT,
-                      font=Theme.font(10), borderwidth=0)
-        
-        for key, label in self.options:
-            menu.add_command(label=label, command=lambda k=key, l=label: self._select(k, l))
+        if self._menu is None:
+            self._menu = tk.Menu(self, tearoff=0, bg=Theme.BG_SECONDARY, fg=Theme.FG,
+                                 activebackground=Theme.ACCENT, activeforeground=Theme.FG_BRIGHT,
+                                 font=_FONT_10, borderwidth=0)
+            for key, label in self.options:
+                self._menu.add_command(label=label, command=lambda k=key, l=label: self._select(k, l))
         
         x = self.winfo_rootx()
         y = self.winfo_rooty() + self.winfo_height()
-        menu.post(x, y)
+        self._menu.post(x, y)
     
     def _select(self, key, label):
         self._selected_key = key
@@ -343,5 +400,5 @@ class Dropdown(tk.Frame):
     
     def set(self, key):
         self._selected_key = key
-        label = next((l for k, l in self.options if k == key), "")
+        label = self._label_by_key.get(key, "")
         self.label.config(text=label)
@@ -5,9 +5,13 @@ Checks GitHub releases for new versions.
 """
 
 import urllib.request
+import urllib.error
 import json
+import queue
+import re
 import threading
 import webbrowser
+from functools import lru_cache
 from typing import Optional, Callable, Tuple
 
 # Current version - UPDATE THIS ON EACH RELEASE
@@ -18,15 +22,31 @@ GITHUB_REPO = "ClarkeFL/project-launch"
 RELEASES_URL = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
 DOWNLOAD_URL = f"https://github.com/{GITHUB_REPO}/releases/latest"
 
+# Last release response, kept so repeat checks can send If-None-Match and
+# reuse it on a 304 instead of downloading the release JSON again
+UPDATE_CACHE_FILE = "update_cache.json"
+_CACHED_RELEASE_FIELDS = ('tag_name', 'name', 'body', 'html_url', 'published_at')
 
+# Upper bound on the release JSON we are willing to read and parse; a real
+# release response is a few KB, this only guards against a runaway body
+_MAX_RESPONSE_BYTES = 256 * 1024
+
+# Leading numeric part of a tag like 'v1.2.3', '1.2' or 'v1.0.0-rc1'
+_VERSION_RE = re.compile(r'v?(\d+)(?:\.(\d+))?(?:\.(\d+))?')
+
+
+@lru_cache(maxsize=32)
 def parse_version(version_str: str) -> Tuple[int, ...]:
-    """Parse version string like 'v0.0.2' or '0.0.2' into tuple of ints."""
-    # Remove 'v' prefix if present
-    version_str = version_str.lstrip('v')
-    try:
-        return tuple(int(x) for x in version_str.split('.'))
-    except ValueError:
+    """
+    Parse version string like 'v0.0.2' or '0.0.2' into tuple of ints.
+    
+    Suffixes such as '-rc1' are ignored and missing parts count as 0;
+    anything without a leading number parses as (0, 0, 0).
+    """
+    match = _VERSION_RE.match(version_str.strip())
+    if not match:
         return (0, 0, 0)
+    return tuple(int(part or 0) for part in match.groups())
 
 
 def compare_versions(current: str, latest: str) -> int:
@@ -44,53 +64,144 @@ def compare_versions(current: str, latest: str) -> int:
     return 0
 
 
+@lru_cache(maxsize=1)
+def _get_opener() -> urllib.request.OpenerDirector:
+    """Build the urllib handler chain (proxy, redirect, HTTPS) once and reuse it."""
+    return urllib.request.build_opener()
+
+
+def _get_update_cache_path():
+    """Get the path of the cached release response."""
+    from config_manager import get_config_dir
+    return get_config_dir() / UPDATE_CACHE_FILE
+
+
+def _load_update_cache() -> dict:
+    """Load the cached ETag and release fields, or {} if there are none."""
+    try:
+        with open(_get_update_cache_path(), 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_update_cache(etag: str, data: dict) -> None:
+    """Store the release response's ETag and the fields check_for_updates uses."""
+    cache = {
+        'etag': etag,
+        'release': {key: data.get(key) for key in _CACHED_RELEASE_FIELDS},
+    }
+    try:
+        cache_path = _get_update_cache_path()
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(cache), encoding='utf-8')
+    except OSError as e:
+        print(f"Could not save update cache: {e}")
+
+
 def check_for_updates() -> Optional[dict]:
     """
     Check GitHub for latest release.
     Returns dict with version info if update available, None otherwise.
     """
     try:
-        request = urllib.request.Request(
-            RELEASES_URL,
-            headers={
-                'User-Agent': 'ProjectLauncher-UpdateChecker',
-                'Accept': 'application/vnd.github.v3+json'
+        headers = {
+            'User-Agent': 'ProjectLauncher-UpdateChecker',
+            'Accept': 'application/vnd.github.v3+json'
+        }
+        
+        # Ask GitHub to skip the body if the release hasn't changed
+        cache = _load_update_cache()
+        if cache.get('etag') and isinstance(cache.get('release'), dict):
+            headers['If-None-Match'] = cache['etag']
+        
+        request = urllib.request.Request(RELEASES_URL, headers=headers)
+        
+        try:
+            with _get_opener().open(request, timeout=10) as response:
+                raw = response.read(_MAX_RESPONSE_BYTES + 1)
+                if len(raw) > _MAX_RESPONSE_BYTES:
+                    raise ValueError("release response too large")
+                data = json.loads(raw.decode('utf-8', errors='replace'))
+                etag = response.headers.get('ETag')
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                raise
+            # Not modified - reuse the release we saw last time
+            data = cache['release']
+        else:
+            if etag:
+                _save_update_cache(etag, data)
+        
+        latest_version = data.get('tag_name') or ''
+        
+        if compare_versions(VERSION, latest_version) < 0:
+            return {
+                'current_version': VERSION,
+                'latest_version': latest_version,
+                'release_name': data.get('name') or '',
+                'release_notes': data.get('body') or '',
+                'download_url': data.get('html_url') or DOWNLOAD_URL,
+                'published_at': data.get('published_at') or ''
             }
-        )
         
-        with urllib.request.urlopen(request, timeout=10) as response:
-            data = json.loads(response.read().decode('utf-8'))
-            
-            latest_version = data.get('tag_name', '')
-            
-            if compare_versions(VERSION, latest_version) < 0:
-                return {
-                    'current_version': VERSION,
-                    'latest_version': latest_version,
-                    'release_name': data.get('name', ''),
-                    'release_notes': data.get('body', ''),
-                    'download_url': data.get('html_url', DOWNLOAD_URL),
-                    'published_at': data.get('published_at', '')
-                }
-            
-            return None
+        return None
             
     except Exception as e:
         print(f"Update check failed: {e}")
         return None
 
 
-def check_for_updates_async(callback: Callable[[Optional[dict]], None]) -> None:
+# Background checks run on a single daemon thread, started on first use and
+# reused for later checks. (A ThreadPoolExecutor's worker is not a daemon
+# and would hold up interpreter exit until an in-flight request timed out.)
+_check_jobs: Optional[queue.SimpleQueue] = None
+_check_jobs_lock = threading.Lock()
+
+
+def _run_check_jobs(jobs: queue.SimpleQueue) -> None:
+    """Worker loop for background update checks."""
+    while True:
+        job = jobs.get()
+        try:
+            job()
+        except Exception as e:
+            print(f"Update check failed: {e}")
+
+
+def _submit_check(job: Callable[[], None]) -> None:
+    """Queue a job on the update-check worker, starting it if needed."""
+    global _check_jobs
+    with _check_jobs_lock:
+        if _check_jobs is None:
+            _check_jobs = queue.SimpleQueue()
+            threading.Thread(target=_run_check_jobs, args=(_check_jobs,),
+                             name="update-check", daemon=True).start()
+    _check_jobs.put(job)
+
+
+def check_for_updates_async(callback: Callable[[Optional[dict]], None],
+                            cancel_event: Optional[threading.Event] = None,
+                            tk_root=None) -> None:
     """
     Check for updates in background thread.
-    Calls callback with result when done.
+    Calls callback with result when done, unless cancel_event has been set.
+    If tk_root is given, the callback is run on the Tk main thread via after().
     """
     def _check():
         result = check_for_updates()
-        callback(result)
+        if cancel_event is not None and cancel_event.is_set():
+            return
+        if tk_root is None:
+            callback(result)
+            return
+        try:
+            tk_root.after(0, callback, result)
+        except Exception:
+            pass  # Window was destroyed while the check ran
     
-    thread = threading.Thread(target=_check, daemon=True)
-    thread.start()
+    _submit_check(_check)
 
 
 def open_download_page(url: str = None) -> None: